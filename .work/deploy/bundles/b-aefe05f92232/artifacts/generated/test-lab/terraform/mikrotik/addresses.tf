@@ -0,0 +1,7 @@
+# MikroTik IP addresses generated from topology
+
+
+# No VLAN addresses configured
+locals {
+  mikrotik_networks_for_addresses = []
+}
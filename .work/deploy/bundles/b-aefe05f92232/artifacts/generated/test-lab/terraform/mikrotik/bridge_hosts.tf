@@ -0,0 +1,13 @@
+# MikroTik MAC-based VLAN assignment (documentation only)
+# Generated from topology device instances with vlan_ref + secrets_ref
+#
+# NOTE: The terraform-routeros provider (checked up to v1.99.1) does NOT
+# support a routeros_interface_bridge_host resource, so bridge host entries
+# cannot be managed via Terraform.
+#
+# MAC -> VLAN assignment is instead delivered via WiFi access-list entries
+# (vlan-id per MAC) by the Ansible playbook:
+#   projects/home-lab/ansible/playbooks/mikrotik-vpn-germany-access-list.yml
+
+# No MAC-based VLAN assignments configured
+# To enable: add vlan_ref and secrets_ref to device instances in data-assets/
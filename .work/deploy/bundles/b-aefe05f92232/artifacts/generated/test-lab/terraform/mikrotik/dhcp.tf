@@ -0,0 +1,9 @@
+# MikroTik DHCP server configuration generated from topology
+# Note: Run scripts/deploy/mikrotik_terraform_import.sh before first apply
+# to import existing resources and ensure idempotent deployments.
+
+
+# No DHCP configuration (VLAN capability not enabled or no VLANs with DHCP)
+locals {
+  mikrotik_networks_for_dhcp = []
+}
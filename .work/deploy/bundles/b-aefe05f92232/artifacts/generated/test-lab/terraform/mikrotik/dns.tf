@@ -0,0 +1,9 @@
+# MikroTik DNS configuration generated from topology
+
+resource "routeros_ip_dns" "settings" {
+  allow_remote_requests = true
+  servers               = ["1.1.1.1", "8.8.8.8"]
+  cache_max_ttl         = "1w"
+  cache_size            = 2048
+}
+
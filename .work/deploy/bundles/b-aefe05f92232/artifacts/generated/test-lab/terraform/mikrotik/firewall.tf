@@ -0,0 +1,30 @@
+# MikroTik firewall rules generated from topology
+# Networks: []
+
+locals {
+  mikrotik_networks_for_firewall = []
+}
+
+# Fallback baseline firewall when no policy rows are defined
+resource "routeros_ip_firewall_filter" "accept_established" {
+  chain            = "forward"
+  action           = "accept"
+  connection_state = "established,related"
+  comment          = "Accept established/related - managed by topology"
+}
+
+resource "routeros_ip_firewall_filter" "drop_invalid" {
+  chain            = "forward"
+  action           = "drop"
+  connection_state = "invalid"
+  comment          = "Drop invalid - managed by topology"
+}
+
+resource "routeros_ip_firewall_filter" "drop_all_forward" {
+  chain                = "forward"
+  action               = "drop"
+  in_interface_list    = "WAN"
+  connection_nat_state = "!dstnat"
+  comment              = "Default deny from WAN not DSTNATed - managed by topology"
+}
+
@@ -0,0 +1,10 @@
+# MikroTik VLAN interfaces generated from topology
+# Routers: []
+
+locals {
+  mikrotik_routers = []
+}
+
+
+
+# No VLANs configured or VLAN capability not enabled
@@ -0,0 +1,11 @@
+output "projection_counts" {
+  description = "Topology projection counts"
+  value = {
+    routers  = 0
+    bridges  = 0
+    networks = 0
+    vlans    = 0
+    services = 0
+  }
+}
+
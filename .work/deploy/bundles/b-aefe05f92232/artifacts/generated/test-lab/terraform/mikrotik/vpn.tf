@@ -0,0 +1,8 @@
+# MikroTik WireGuard VPN configuration
+# Generated from topology - DO NOT EDIT MANUALLY
+
+locals {
+  wireguard_interface_name = "wg0"
+}
+
+# WireGuard capability not enabled - no resources generated
@@ -0,0 +1,9 @@
+# MikroTik WiFi configuration generated from topology
+# RouterOS 7 WiFi (wave2) with VLAN datapath support
+#
+# NOTE: The routeros Terraform provider does not support WiFi resources.
+# WiFi configuration must be applied via RSC script through SSH.
+#
+# Apply WiFi configuration:
+#   scp generated/home-lab/mikrotik/wifi-config.rsc admin@192.168.88.1:
+#   ssh admin@192.168.88.1 "/import wifi-config.rsc"
@@ -0,0 +1,13 @@
+# MikroTik Zone-Based Firewall Rules (ADR 0110)
+# Generated from security_matrix: unknown
+#
+# Rule Order (CRITICAL - MikroTik default-allow requires explicit deny):
+# 1. Established/related → accept
+# 2. Policy override ACCEPTs → accept
+# 3. Matrix DENY (isolated) → drop + log
+# 4. Matrix DENY (uphill) → drop + log
+# 5. Matrix ALLOW (downhill) → accept
+# 6. FINAL DROP-ALL → drop + log
+
+# Security matrix not configured for this router.
+# Using fallback firewall rules from firewall.tf
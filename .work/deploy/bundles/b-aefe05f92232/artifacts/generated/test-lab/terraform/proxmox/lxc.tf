@@ -0,0 +1,4 @@
+# Baseline projection output; LXC resource rendering is added in parity phase.
+locals {
+  lxc_instances = []
+}
@@ -0,0 +1,7 @@
+output "projection_counts" {
+  value = {
+    proxmox_nodes = 0
+    lxc           = 0
+    services      = 0
+  }
+}
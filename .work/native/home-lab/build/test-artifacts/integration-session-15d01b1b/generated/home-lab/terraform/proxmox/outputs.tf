@@ -0,0 +1,7 @@
+output "projection_counts" {
+  value = {
+    proxmox_nodes = 1
+    lxc           = 9
+    services      = 9
+  }
+}
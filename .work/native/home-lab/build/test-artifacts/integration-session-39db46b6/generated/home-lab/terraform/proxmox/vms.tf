@@ -0,0 +1,4 @@
+# Baseline projection output; VM resource rendering is added in parity phase.
+locals {
+  vm_instances = []
+}
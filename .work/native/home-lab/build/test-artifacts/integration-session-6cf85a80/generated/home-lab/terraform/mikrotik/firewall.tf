@@ -0,0 +1,98 @@
+# MikroTik firewall rules generated from topology
+# Networks: ["inst.bridge.containers", "inst.bridge.vmbr0", "inst.routing_policy.vpn_germany", "inst.security_matrix.mikrotik", "inst.security_matrix.proxmox", "inst.trust_zone.guest", "inst.trust_zone.iot", "inst.trust_zone.management", "inst.trust_zone.servers", "inst.trust_zone.untrusted", "inst.trust_zone.user", "inst.trust_zone.vpn_tunnel", "inst.tunnel.wg-home-to-oci", "inst.vlan.guest", "inst.vlan.iot", "inst.vlan.lan", "inst.vlan.management", "inst.vlan.servers", "inst.vlan.user", "inst.vlan.vpn_germany"]
+
+locals {
+  mikrotik_networks_for_firewall = ["inst.bridge.containers", "inst.bridge.vmbr0", "inst.routing_policy.vpn_germany", "inst.security_matrix.mikrotik", "inst.security_matrix.proxmox", "inst.trust_zone.guest", "inst.trust_zone.iot", "inst.trust_zone.management", "inst.trust_zone.servers", "inst.trust_zone.untrusted", "inst.trust_zone.user", "inst.trust_zone.vpn_tunnel", "inst.tunnel.wg-home-to-oci", "inst.vlan.guest", "inst.vlan.iot", "inst.vlan.lan", "inst.vlan.management", "inst.vlan.servers", "inst.vlan.user", "inst.vlan.vpn_germany"]
+}
+
+# Firewall policies from topology
+resource "routeros_ip_firewall_filter" "established_related_stateful" {
+  chain            = "forward"
+  action           = "accept"
+  connection_state = "established,related"
+  comment          = "Allow established and related connections - managed by topology"
+}
+
+resource "routeros_ip_firewall_filter" "guest_isolated_rule_1" {
+  chain   = "forward"
+  action  = "drop"
+  src_address = "192.168.20.0/24"
+  dst_address = "10.0.30.0/24"
+  comment = "Guest cannot access servers - managed by topology"
+}
+
+resource "routeros_ip_firewall_filter" "guest_isolated_rule_2" {
+  chain   = "forward"
+  action  = "drop"
+  src_address = "192.168.20.0/24"
+  dst_address = "10.0.99.0/24"
+  comment = "Guest cannot access management - managed by topology"
+}
+
+resource "routeros_ip_firewall_filter" "guest_isolated_rule_3" {
+  chain   = "forward"
+  action  = "drop"
+  src_address = "192.168.20.0/24"
+  dst_address = "192.168.10.0/24"
+  comment = "Guest cannot access user network - managed by topology"
+}
+
+resource "routeros_ip_firewall_filter" "guest_isolated_rule_4" {
+  chain   = "forward"
+  action  = "drop"
+  src_address = "192.168.20.0/24"
+  dst_address = "192.168.30.0/24"
+  comment = "Guest cannot access IoT - managed by topology"
+}
+
+resource "routeros_ip_firewall_filter" "iot_isolated_rule_1" {
+  chain   = "forward"
+  action  = "drop"
+  src_address = "192.168.30.0/24"
+  dst_address = "10.0.30.0/24"
+  comment = "IoT cannot access servers - managed by topology"
+}
+
+resource "routeros_ip_firewall_filter" "iot_isolated_rule_2" {
+  chain   = "forward"
+  action  = "drop"
+  src_address = "192.168.30.0/24"
+  dst_address = "10.0.99.0/24"
+  comment = "IoT cannot access management - managed by topology"
+}
+
+resource "routeros_ip_firewall_filter" "iot_isolated_rule_3" {
+  chain   = "forward"
+  action  = "drop"
+  src_address = "192.168.30.0/24"
+  dst_address = "192.168.10.0/24"
+  comment = "IoT cannot access user network - managed by topology"
+}
+
+resource "routeros_ip_firewall_filter" "default_deny_wan_default_deny" {
+  chain                = "forward"
+  action               = "drop"
+  in_interface_list    = "WAN"
+  connection_nat_state = "!dstnat"
+  comment              = "Default deny policy for unsolicited WAN traffic (!dstnat); does not block LAN to WAN forwarding - managed by topology"
+}
+
+
+# NAT rules from runtime topology baseline
+resource "routeros_ip_firewall_nat" "runtime_nat_1" {
+  chain  = "srcnat"
+  action = "masquerade"
+  out_interface = "ether1"
+  comment = "runtime NAT baseline - managed by topology"
+}
+
+resource "routeros_ip_firewall_nat" "runtime_nat_2" {
+  chain  = "dstnat"
+  action = "dst-nat"
+  protocol = "tcp"
+  dst_port = "8080"
+  to_addresses = "172.18.0.2"
+  to_ports = "80"
+  comment = "runtime NAT baseline - managed by topology"
+}
+
@@ -0,0 +1,4 @@
+# Baseline projection output; bridge resources are added in parity phase.
+locals {
+  proxmox_nodes = ["srv-gamayun"]
+}
@@ -0,0 +1,71 @@
+variable "mikrotik_host" {
+  description = "MikroTik router URL (https://ip:port)"
+  type        = string
+}
+
+variable "mikrotik_username" {
+  description = "MikroTik API username"
+  type        = string
+  default     = "terraform"
+}
+
+variable "mikrotik_password" {
+  description = "MikroTik API password"
+  type        = string
+  sensitive   = true
+}
+
+variable "mikrotik_insecure" {
+  description = "Skip TLS certificate verification"
+  type        = bool
+  default     = true
+}
+
+variable "wireguard_private_key" {
+  description = "WireGuard private key"
+  type        = string
+  sensitive   = true
+  default     = ""
+}
+
+variable "wireguard_peers" {
+  description = "WireGuard peers list"
+  type = list(object({
+    name             = string
+    public_key       = string
+    preshared_key    = optional(string)
+    endpoint_address = optional(string)
+    endpoint_port    = optional(number)
+    allowed_ips      = list(string)
+    persistent_keepalive = optional(string)
+    comment          = optional(string)
+  }))
+  default = []
+}
+
+variable "adguard_password" {
+  description = "AdGuard Home admin password (hash)"
+  type        = string
+  sensitive   = true
+  default     = ""
+}
+
+variable "tailscale_authkey" {
+  description = "Tailscale auth key"
+  type        = string
+  sensitive   = true
+  default     = ""
+}
+# NOTE: WiFi passphrases are managed via RSC scripts, not Terraform variables.
+# The routeros provider does not support WiFi resources.
+
+variable "mac_vlan_assignments" {
+  description = "MAC-based VLAN assignments for bridge host entries"
+  type = list(object({
+    device_id   = string
+    mac_address = string
+    vlan_id     = number
+    comment     = optional(string)
+  }))
+  default = []
+}
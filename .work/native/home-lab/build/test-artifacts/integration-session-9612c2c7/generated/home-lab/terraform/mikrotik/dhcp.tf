@@ -0,0 +1,150 @@
+# MikroTik DHCP server configuration generated from topology
+# Note: Run scripts/deploy/mikrotik_terraform_import.sh before first apply
+# to import existing resources and ensure idempotent deployments.
+
+# Baseline LAN DHCP from router profile
+resource "routeros_ip_pool" "lan_pool" {
+  name   = "default-dhcp"
+  ranges = ["192.168.88.10-192.168.88.254"]
+
+  lifecycle {
+    # Prevent recreation if pool already exists with same name
+    create_before_destroy = false
+  }
+}
+
+resource "routeros_ip_dhcp_server" "lan_dhcp" {
+  name                       = "defconf"
+  interface                  = "bridge"
+  address_pool               = routeros_ip_pool.lan_pool.name
+  lease_time                 = "30m"
+  disabled                   = false
+  comment                    = "LAN DHCP - managed by topology"
+  dynamic_lease_identifiers  = "client-mac,client-id"
+}
+
+resource "routeros_ip_dhcp_server_network" "lan_network" {
+  address    = "192.168.88.0/24"
+  gateway    = "192.168.88.1"
+  dns_server = ["1.1.1.1", "8.8.8.8"]
+  comment    = "LAN DHCP network - managed by topology"
+}
+
+
+# DHCP pools and servers for VLANs with DHCP enabled
+resource "routeros_ip_pool" "user_pool" {
+  name   = "user_pool"
+  ranges = ["192.168.10.100-192.168.10.254"]
+
+  lifecycle {
+    create_before_destroy = false
+  }
+}
+
+resource "routeros_ip_dhcp_server" "user_dhcp" {
+  name                       = "user_dhcp"
+  interface                  = routeros_interface_vlan.user.name
+  address_pool               = routeros_ip_pool.user_pool.name
+  disabled                   = false
+  comment                    = "inst.vlan.user DHCP - managed by topology"
+  dynamic_lease_identifiers  = "client-mac,client-id"
+
+  lifecycle {
+    create_before_destroy = false
+  }
+}
+
+resource "routeros_ip_dhcp_server_network" "user" {
+  address    = "192.168.10.0/24"
+  gateway    = "192.168.10.1"
+  dns_server = ["192.168.10.1"]
+  comment    = "inst.vlan.user DHCP network - managed by topology"
+}
+
+resource "routeros_ip_pool" "guest_pool" {
+  name   = "guest_pool"
+  ranges = ["192.168.20.100-192.168.20.200"]
+
+  lifecycle {
+    create_before_destroy = false
+  }
+}
+
+resource "routeros_ip_dhcp_server" "guest_dhcp" {
+  name                       = "guest_dhcp"
+  interface                  = routeros_interface_vlan.guest.name
+  address_pool               = routeros_ip_pool.guest_pool.name
+  disabled                   = false
+  comment                    = "inst.vlan.guest DHCP - managed by topology"
+  dynamic_lease_identifiers  = "client-mac,client-id"
+
+  lifecycle {
+    create_before_destroy = false
+  }
+}
+
+resource "routeros_ip_dhcp_server_network" "guest" {
+  address    = "192.168.20.0/24"
+  gateway    = "192.168.20.1"
+  dns_server = ["1.1.1.1", "8.8.8.8"]
+  comment    = "inst.vlan.guest DHCP network - managed by topology"
+}
+
+resource "routeros_ip_pool" "iot_pool" {
+  name   = "iot_pool"
+  ranges = ["192.168.30.100-192.168.30.200"]
+
+  lifecycle {
+    create_before_destroy = false
+  }
+}
+
+resource "routeros_ip_dhcp_server" "iot_dhcp" {
+  name                       = "iot_dhcp"
+  interface                  = routeros_interface_vlan.iot.name
+  address_pool               = routeros_ip_pool.iot_pool.name
+  disabled                   = false
+  comment                    = "inst.vlan.iot DHCP - managed by topology"
+  dynamic_lease_identifiers  = "client-mac,client-id"
+
+  lifecycle {
+    create_before_destroy = false
+  }
+}
+
+resource "routeros_ip_dhcp_server_network" "iot" {
+  address    = "192.168.30.0/24"
+  gateway    = "192.168.30.1"
+  dns_server = ["192.168.30.1"]
+  comment    = "inst.vlan.iot DHCP network - managed by topology"
+}
+
+resource "routeros_ip_pool" "vpn_germany_pool" {
+  name   = "vpn_germany_pool"
+  ranges = ["192.168.55.100-192.168.55.200"]
+
+  lifecycle {
+    create_before_destroy = false
+  }
+}
+
+resource "routeros_ip_dhcp_server" "vpn_germany_dhcp" {
+  name                       = "vpn_germany_dhcp"
+  interface                  = routeros_interface_vlan.vpn_germany.name
+  address_pool               = routeros_ip_pool.vpn_germany_pool.name
+  disabled                   = false
+  comment                    = "inst.vlan.vpn_germany DHCP - managed by topology"
+  dynamic_lease_identifiers  = "client-mac,client-id"
+
+  lifecycle {
+    create_before_destroy = false
+  }
+}
+
+resource "routeros_ip_dhcp_server_network" "vpn_germany" {
+  address    = "192.168.55.0/24"
+  gateway    = "192.168.55.1"
+  dns_server = ["1.1.1.1", "8.8.8.8"]
+  comment    = "inst.vlan.vpn_germany DHCP network - managed by topology"
+}
+
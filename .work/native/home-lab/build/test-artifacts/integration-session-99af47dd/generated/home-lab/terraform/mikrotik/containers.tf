@@ -0,0 +1,4 @@
+# Baseline projection output; container resources are added in parity phase.
+locals {
+  mikrotik_service_instances = ["svc-mikrotik-ui", "svc-ntp", "svc-snmp", "svc-syslog-forward", "svc-wireguard"]
+}
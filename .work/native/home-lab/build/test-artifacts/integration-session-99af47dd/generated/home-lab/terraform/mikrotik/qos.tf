@@ -0,0 +1,4 @@
+# Baseline projection output; QoS resources are added in parity phase.
+locals {
+  mikrotik_qos_profiles = []
+}
@@ -0,0 +1,20 @@
+# MikroTik WiFi configuration generated from topology
+# RouterOS 7 WiFi (wave2) with VLAN datapath support
+#
+# NOTE: The routeros Terraform provider does not support WiFi resources.
+# WiFi configuration must be applied via RSC script through SSH.
+#
+# Apply WiFi configuration:
+#   scp generated/home-lab/mikrotik/wifi-config.rsc admin@192.168.88.1:
+#   ssh admin@192.168.88.1 "/import wifi-config.rsc"
+
+# WiFi configuration summary from topology:
+# - Datapath: dp-main-lan (bridge=bridge)
+# - Datapath: dp-vpn-germany (bridge=bridge, vlan_id=55)
+# - Datapath: dp-guest (bridge=bridge, vlan_id=20)
+# - Datapath: dp-iot (bridge=bridge, vlan_id=30)
+# - SSID: Chateau* (cfg-wifi1, datapath=dp-main-lan)
+# - SSID: Chateau (cfg-wifi2, datapath=dp-main-lan)
+# - SSID: VPN-Germany (cfg-wifi_vpn_germany, datapath=dp-vpn-germany)
+# - SSID: Guest (cfg-wifi_guest, datapath=dp-guest)
+# - SSID: IoT (cfg-wifi_iot, datapath=dp-iot)
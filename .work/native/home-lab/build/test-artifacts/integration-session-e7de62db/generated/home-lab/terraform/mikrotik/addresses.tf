@@ -0,0 +1,76 @@
+# MikroTik IP addresses generated from topology
+
+
+# Gateway addresses for VLANs
+resource "routeros_ip_address" "lan" {
+  address   = "192.168.88.1/24"
+  interface = "bridge"
+  comment   = "inst.vlan.lan gateway - managed by topology"
+
+  lifecycle {
+    create_before_destroy = false
+    # vrf not supported via REST API in RouterOS 7.x
+    ignore_changes = [vrf]
+  }
+}
+
+resource "routeros_ip_address" "user" {
+  address   = "192.168.10.1/24"
+  interface = routeros_interface_vlan.user.name
+  comment   = "inst.vlan.user gateway - managed by topology"
+
+  lifecycle {
+    create_before_destroy = false
+    # vrf not supported via REST API in RouterOS 7.x
+    ignore_changes = [vrf]
+  }
+}
+
+resource "routeros_ip_address" "guest" {
+  address   = "192.168.20.1/24"
+  interface = routeros_interface_vlan.guest.name
+  comment   = "inst.vlan.guest gateway - managed by topology"
+
+  lifecycle {
+    create_before_destroy = false
+    # vrf not supported via REST API in RouterOS 7.x
+    ignore_changes = [vrf]
+  }
+}
+
+resource "routeros_ip_address" "iot" {
+  address   = "192.168.30.1/24"
+  interface = routeros_interface_vlan.iot.name
+  comment   = "inst.vlan.iot gateway - managed by topology"
+
+  lifecycle {
+    create_before_destroy = false
+    # vrf not supported via REST API in RouterOS 7.x
+    ignore_changes = [vrf]
+  }
+}
+
+resource "routeros_ip_address" "vpn_germany" {
+  address   = "192.168.55.1/24"
+  interface = routeros_interface_vlan.vpn_germany.name
+  comment   = "inst.vlan.vpn_germany gateway - managed by topology"
+
+  lifecycle {
+    create_before_destroy = false
+    # vrf not supported via REST API in RouterOS 7.x
+    ignore_changes = [vrf]
+  }
+}
+
+resource "routeros_ip_address" "management" {
+  address   = "10.0.99.1/24"
+  interface = routeros_interface_vlan.management.name
+  comment   = "inst.vlan.management gateway - managed by topology"
+
+  lifecycle {
+    create_before_destroy = false
+    # vrf not supported via REST API in RouterOS 7.x
+    ignore_changes = [vrf]
+  }
+}
+
@@ -0,0 +1,59 @@
+# MikroTik DNS configuration generated from topology
+
+resource "routeros_ip_dns" "settings" {
+  allow_remote_requests = true
+  servers               = ["1.1.1.1", "8.8.8.8"]
+  cache_max_ttl         = "1w"
+  cache_size            = 2048
+}
+
+# Static DNS entries for VLAN gateways
+resource "routeros_ip_dns_record" "servers_gw" {
+  name    = "gw-servers.lan"
+  address = "10.0.30.1"
+  type    = "A"
+  comment = "inst.vlan.servers gateway - managed by topology"
+}
+
+resource "routeros_ip_dns_record" "lan_gw" {
+  name    = "gw-lan.lan"
+  address = "192.168.88.1"
+  type    = "A"
+  comment = "inst.vlan.lan gateway - managed by topology"
+}
+
+resource "routeros_ip_dns_record" "user_gw" {
+  name    = "gw-user.lan"
+  address = "192.168.10.1"
+  type    = "A"
+  comment = "inst.vlan.user gateway - managed by topology"
+}
+
+resource "routeros_ip_dns_record" "guest_gw" {
+  name    = "gw-guest.lan"
+  address = "192.168.20.1"
+  type    = "A"
+  comment = "inst.vlan.guest gateway - managed by topology"
+}
+
+resource "routeros_ip_dns_record" "iot_gw" {
+  name    = "gw-iot.lan"
+  address = "192.168.30.1"
+  type    = "A"
+  comment = "inst.vlan.iot gateway - managed by topology"
+}
+
+resource "routeros_ip_dns_record" "vpn_germany_gw" {
+  name    = "gw-vpn_germany.lan"
+  address = "192.168.55.1"
+  type    = "A"
+  comment = "inst.vlan.vpn_germany gateway - managed by topology"
+}
+
+resource "routeros_ip_dns_record" "management_gw" {
+  name    = "gw-management.lan"
+  address = "10.0.99.1"
+  type    = "A"
+  comment = "inst.vlan.management gateway - managed by topology"
+}
+
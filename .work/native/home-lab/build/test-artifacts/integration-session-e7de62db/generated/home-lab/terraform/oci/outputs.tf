@@ -0,0 +1,17 @@
+# OCI Instance Outputs
+
+output "vps_oracle_frankfurt_id" {
+  description = "OCID of the instance-20260608-1006 instance"
+  value       = oci_core_instance.vps_oracle_frankfurt.id
+}
+
+output "vps_oracle_frankfurt_public_ip" {
+  description = "Public IP of the instance-20260608-1006 instance"
+  value       = oci_core_instance.vps_oracle_frankfurt.public_ip
+}
+
+output "vps_oracle_frankfurt_private_ip" {
+  description = "Private IP of the instance-20260608-1006 instance"
+  value       = oci_core_instance.vps_oracle_frankfurt.private_ip
+}
+
@@ -0,0 +1,90 @@
+resource "oci_core_instance" "vps_oracle_frankfurt" {
+  agent_config {
+    is_management_disabled = "false"
+    is_monitoring_disabled = "false"
+    plugins_config {
+      desired_state = "DISABLED"
+      name          = "Vulnerability Scanning"
+    }
+    plugins_config {
+      desired_state = "DISABLED"
+      name          = "OS Management Hub Agent"
+    }
+    plugins_config {
+      desired_state = "DISABLED"
+      name          = "Management Agent"
+    }
+    plugins_config {
+      desired_state = "ENABLED"
+      name          = "Custom Logs Monitoring"
+    }
+    plugins_config {
+      desired_state = "DISABLED"
+      name          = "Compute RDMA GPU Monitoring"
+    }
+    plugins_config {
+      desired_state = "ENABLED"
+      name          = "Compute Instance Monitoring"
+    }
+    plugins_config {
+      desired_state = "DISABLED"
+      name          = "Compute HPC RDMA Auto-Configuration"
+    }
+    plugins_config {
+      desired_state = "DISABLED"
+      name          = "Compute HPC RDMA Authentication"
+    }
+    plugins_config {
+      desired_state = "ENABLED"
+      name          = "Cloud Guard Workload Protection"
+    }
+    plugins_config {
+      desired_state = "DISABLED"
+      name          = "Block Volume Management"
+    }
+    plugins_config {
+      desired_state = "DISABLED"
+      name          = "Bastion"
+    }
+  }
+
+  availability_config {
+    recovery_action = "RESTORE_INSTANCE"
+  }
+
+  availability_domain = var.availability_domain
+  compartment_id      = var.compartment_id
+
+  create_vnic_details {
+    assign_ipv6ip             = "false"
+    assign_private_dns_record = "true"
+    assign_public_ip          = "true"
+    display_name              = "Main VNIC"
+    subnet_id                 = var.subnet_id
+  }
+
+  display_name = "instance-20260608-1006"
+
+  instance_options {
+    are_legacy_imds_endpoints_disabled = "true"
+  }
+
+  is_pv_encryption_in_transit_enabled = "true"
+
+  metadata = {
+    "ssh_authorized_keys" = var.ssh_public_key
+  }
+
+  shape = "VM.Standard.E2.1.Micro"
+
+  shape_config {
+    memory_in_gbs = "1"
+    ocpus         = "1"
+  }
+
+  source_details {
+    source_id   = var.image_id
+    source_type = "image"
+  }
+}
+
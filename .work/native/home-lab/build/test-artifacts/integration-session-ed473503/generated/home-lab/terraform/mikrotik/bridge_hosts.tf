@@ -0,0 +1,15 @@
+# MikroTik MAC-based VLAN assignment (documentation only)
+# Generated from topology device instances with vlan_ref + secrets_ref
+#
+# NOTE: The terraform-routeros provider (checked up to v1.99.1) does NOT
+# support a routeros_interface_bridge_host resource, so bridge host entries
+# cannot be managed via Terraform.
+#
+# MAC -> VLAN assignment is instead delivered via WiFi access-list entries
+# (vlan-id per MAC) by the Ansible playbook:
+#   projects/home-lab/ansible/playbooks/mikrotik-vpn-germany-access-list.yml
+
+# MAC-based VLAN assignments from device instances (applied via access-list):
+# - Jolla Phone 2026: instances/jolla-phone-2026.yaml -> VLAN 1
+# - BOOX Go 10.3 Gen II Lumi: instances/boox-go-103-lumi.yaml -> VLAN 55
+# - Sony Bravia AJ9: instances/tv-sony-bravia.yaml -> VLAN 55
@@ -0,0 +1,486 @@
+# MikroTik Zone-Based Firewall Rules (ADR 0110)
+# Generated from security_matrix: inst.security_matrix.mikrotik
+#
+# Rule Order (CRITICAL - MikroTik default-allow requires explicit deny):
+# 1. Established/related → accept
+# 2. Policy override ACCEPTs → accept
+# 3. Matrix DENY (isolated) → drop + log
+# 4. Matrix DENY (uphill) → drop + log
+# 5. Matrix ALLOW (downhill) → accept
+# 6. FINAL DROP-ALL → drop + log
+
+
+# ==============================================================================
+# Zone Address Lists
+# ==============================================================================
+resource "routeros_ip_firewall_addr_list" "zone_guest_1" {
+  list    = "zone-guest"
+  address = "192.168.20.0/24"
+  comment = "Zone: Guest Zone (level=0, isolated) - managed by topology"
+}
+
+resource "routeros_ip_firewall_addr_list" "zone_iot_1" {
+  list    = "zone-iot"
+  address = "192.168.30.0/24"
+  comment = "Zone: IoT Zone (level=1, isolated) - managed by topology"
+}
+
+resource "routeros_ip_firewall_addr_list" "zone_management_1" {
+  list    = "zone-management"
+  address = "10.0.99.0/24"
+  comment = "Zone: Management Zone (level=5) - managed by topology"
+}
+
+resource "routeros_ip_firewall_addr_list" "zone_servers_1" {
+  list    = "zone-servers"
+  address = "10.0.30.0/24"
+  comment = "Zone: Servers Zone (level=4) - managed by topology"
+}
+
+resource "routeros_ip_firewall_addr_list" "zone_user_1" {
+  list    = "zone-user"
+  address = "192.168.88.0/24"
+  comment = "Zone: User Zone (level=3) - managed by topology"
+}
+
+resource "routeros_ip_firewall_addr_list" "zone_user_2" {
+  list    = "zone-user"
+  address = "192.168.10.0/24"
+  comment = "Zone: User Zone (level=3) - managed by topology"
+}
+
+resource "routeros_ip_firewall_addr_list" "zone_vpn_tunnel_1" {
+  list    = "zone-vpn_tunnel"
+  address = "192.168.55.0/24"
+  comment = "Zone: VPN Tunnel Zone (level=2) - managed by topology"
+}
+
+
+# ==============================================================================
+# 1. Established/Related Rule (FIRST)
+# ==============================================================================
+resource "routeros_ip_firewall_filter" "zone_established_related" {
+  chain            = "forward"
+  action           = "accept"
+  connection_state = "established,related"
+  comment          = "ADR-0110: Accept established/related - managed by topology"
+}
+
+# ==============================================================================
+# 2. Policy Override ACCEPT Rules
+# ==============================================================================
+resource "routeros_ip_firewall_filter" "zone_override_user_to_servers_db_tcp" {
+  chain            = "forward"
+  action           = "accept"
+  src_address_list = "zone-user"
+  dst_address_list = "zone-servers"
+  protocol         = "tcp"
+  dst_port         = "5432,6379"
+  comment          = "ADR-0110 R6: PostgreSQL and Redis access from user zone - managed by topology"
+  place_before     = routeros_ip_firewall_filter.zone_drop_all_forward.id
+}
+
+resource "routeros_ip_firewall_filter" "zone_override_management_to_servers_full" {
+  chain            = "forward"
+  action           = "accept"
+  src_address_list = "zone-management"
+  dst_address_list = "zone-servers"
+  comment          = "ADR-0110 R6: Management plane has full access to servers zone - managed by topology"
+  place_before     = routeros_ip_firewall_filter.zone_drop_all_forward.id
+}
+
+
+# ==============================================================================
+# 3-4. Matrix DENY Rules (isolated and uphill)
+# ==============================================================================
+resource "routeros_ip_firewall_filter" "zone_deny_untrusted_to_guest" {
+  chain            = "forward"
+  action           = "drop"
+  src_address_list = "zone-untrusted"
+  dst_address_list = "zone-guest"
+  log              = true
+  log_prefix       = "DENY:untrusted→guest"
+  comment          = "ADR-0110 R5: same level 0, no override - managed by topology"
+  place_before     = routeros_ip_firewall_filter.zone_drop_all_forward.id
+}
+
+resource "routeros_ip_firewall_filter" "zone_deny_untrusted_to_iot" {
+  chain            = "forward"
+  action           = "drop"
+  src_address_list = "zone-untrusted"
+  dst_address_list = "zone-iot"
+  log              = true
+  log_prefix       = "DENY:untrusted→iot"
+  comment          = "ADR-0110 R4: uphill: level 0 → 1 - managed by topology"
+  place_before     = routeros_ip_firewall_filter.zone_drop_all_forward.id
+}
+
+resource "routeros_ip_firewall_filter" "zone_deny_untrusted_to_vpn_tunnel" {
+  chain            = "forward"
+  action           = "drop"
+  src_address_list = "zone-untrusted"
+  dst_address_list = "zone-vpn_tunnel"
+  log              = true
+  log_prefix       = "DENY:untrusted→vpn_tunnel"
+  comment          = "ADR-0110 R4: uphill: level 0 → 2 - managed by topology"
+  place_before     = routeros_ip_firewall_filter.zone_drop_all_forward.id
+}
+
+resource "routeros_ip_firewall_filter" "zone_deny_untrusted_to_user" {
+  chain            = "forward"
+  action           = "drop"
+  src_address_list = "zone-untrusted"
+  dst_address_list = "zone-user"
+  log              = true
+  log_prefix       = "DENY:untrusted→user"
+  comment          = "ADR-0110 R4: uphill: level 0 → 3 - managed by topology"
+  place_before     = routeros_ip_firewall_filter.zone_drop_all_forward.id
+}
+
+resource "routeros_ip_firewall_filter" "zone_deny_untrusted_to_servers" {
+  chain            = "forward"
+  action           = "drop"
+  src_address_list = "zone-untrusted"
+  dst_address_list = "zone-servers"
+  log              = true
+  log_prefix       = "DENY:untrusted→servers"
+  comment          = "ADR-0110 R4: uphill: level 0 → 4 - managed by topology"
+  place_before     = routeros_ip_firewall_filter.zone_drop_all_forward.id
+}
+
+resource "routeros_ip_firewall_filter" "zone_deny_untrusted_to_management" {
+  chain            = "forward"
+  action           = "drop"
+  src_address_list = "zone-untrusted"
+  dst_address_list = "zone-management"
+  log              = true
+  log_prefix       = "DENY:untrusted→management"
+  comment          = "ADR-0110 R4: uphill: level 0 → 5 - managed by topology"
+  place_before     = routeros_ip_firewall_filter.zone_drop_all_forward.id
+}
+
+resource "routeros_ip_firewall_filter" "zone_deny_guest_to_iot" {
+  chain            = "forward"
+  action           = "drop"
+  src_address_list = "zone-guest"
+  dst_address_list = "zone-iot"
+  log              = true
+  log_prefix       = "DENY:guest→iot"
+  comment          = "ADR-0110 R2: isolated zone cannot reach inst.trust_zone.iot - managed by topology"
+  place_before     = routeros_ip_firewall_filter.zone_drop_all_forward.id
+}
+
+resource "routeros_ip_firewall_filter" "zone_deny_guest_to_vpn_tunnel" {
+  chain            = "forward"
+  action           = "drop"
+  src_address_list = "zone-guest"
+  dst_address_list = "zone-vpn_tunnel"
+  log              = true
+  log_prefix       = "DENY:guest→vpn_tunnel"
+  comment          = "ADR-0110 R2: isolated zone cannot reach inst.trust_zone.vpn_tunnel - managed by topology"
+  place_before     = routeros_ip_firewall_filter.zone_drop_all_forward.id
+}
+
+resource "routeros_ip_firewall_filter" "zone_deny_guest_to_user" {
+  chain            = "forward"
+  action           = "drop"
+  src_address_list = "zone-guest"
+  dst_address_list = "zone-user"
+  log              = true
+  log_prefix       = "DENY:guest→user"
+  comment          = "ADR-0110 R2: isolated zone cannot reach inst.trust_zone.user - managed by topology"
+  place_before     = routeros_ip_firewall_filter.zone_drop_all_forward.id
+}
+
+resource "routeros_ip_firewall_filter" "zone_deny_guest_to_servers" {
+  chain            = "forward"
+  action           = "drop"
+  src_address_list = "zone-guest"
+  dst_address_list = "zone-servers"
+  log              = true
+  log_prefix       = "DENY:guest→servers"
+  comment          = "ADR-0110 R2: isolated zone cannot reach inst.trust_zone.servers - managed by topology"
+  place_before     = routeros_ip_firewall_filter.zone_drop_all_forward.id
+}
+
+resource "routeros_ip_firewall_filter" "zone_deny_guest_to_management" {
+  chain            = "forward"
+  action           = "drop"
+  src_address_list = "zone-guest"
+  dst_address_list = "zone-management"
+  log              = true
+  log_prefix       = "DENY:guest→management"
+  comment          = "ADR-0110 R2: isolated zone cannot reach inst.trust_zone.management - managed by topology"
+  place_before     = routeros_ip_firewall_filter.zone_drop_all_forward.id
+}
+
+resource "routeros_ip_firewall_filter" "zone_deny_iot_to_guest" {
+  chain            = "forward"
+  action           = "drop"
+  src_address_list = "zone-iot"
+  dst_address_list = "zone-guest"
+  log              = true
+  log_prefix       = "DENY:iot→guest"
+  comment          = "ADR-0110 R2: isolated zone cannot reach inst.trust_zone.guest - managed by topology"
+  place_before     = routeros_ip_firewall_filter.zone_drop_all_forward.id
+}
+
+resource "routeros_ip_firewall_filter" "zone_deny_iot_to_vpn_tunnel" {
+  chain            = "forward"
+  action           = "drop"
+  src_address_list = "zone-iot"
+  dst_address_list = "zone-vpn_tunnel"
+  log              = true
+  log_prefix       = "DENY:iot→vpn_tunnel"
+  comment          = "ADR-0110 R2: isolated zone cannot reach inst.trust_zone.vpn_tunnel - managed by topology"
+  place_before     = routeros_ip_firewall_filter.zone_drop_all_forward.id
+}
+
+resource "routeros_ip_firewall_filter" "zone_deny_iot_to_user" {
+  chain            = "forward"
+  action           = "drop"
+  src_address_list = "zone-iot"
+  dst_address_list = "zone-user"
+  log              = true
+  log_prefix       = "DENY:iot→user"
+  comment          = "ADR-0110 R2: isolated zone cannot reach inst.trust_zone.user - managed by topology"
+  place_before     = routeros_ip_firewall_filter.zone_drop_all_forward.id
+}
+
+resource "routeros_ip_firewall_filter" "zone_deny_iot_to_servers" {
+  chain            = "forward"
+  action           = "drop"
+  src_address_list = "zone-iot"
+  dst_address_list = "zone-servers"
+  log              = true
+  log_prefix       = "DENY:iot→servers"
+  comment          = "ADR-0110 R2: isolated zone cannot reach inst.trust_zone.servers - managed by topology"
+  place_before     = routeros_ip_firewall_filter.zone_drop_all_forward.id
+}
+
+resource "routeros_ip_firewall_filter" "zone_deny_iot_to_management" {
+  chain            = "forward"
+  action           = "drop"
+  src_address_list = "zone-iot"
+  dst_address_list = "zone-management"
+  log              = true
+  log_prefix       = "DENY:iot→management"
+  comment          = "ADR-0110 R2: isolated zone cannot reach inst.trust_zone.management - managed by topology"
+  place_before     = routeros_ip_firewall_filter.zone_drop_all_forward.id
+}
+
+resource "routeros_ip_firewall_filter" "zone_deny_vpn_tunnel_to_user" {
+  chain            = "forward"
+  action           = "drop"
+  src_address_list = "zone-vpn_tunnel"
+  dst_address_list = "zone-user"
+  log              = true
+  log_prefix       = "DENY:vpn_tunnel→user"
+  comment          = "ADR-0110 R4: uphill: level 2 → 3 - managed by topology"
+  place_before     = routeros_ip_firewall_filter.zone_drop_all_forward.id
+}
+
+resource "routeros_ip_firewall_filter" "zone_deny_vpn_tunnel_to_servers" {
+  chain            = "forward"
+  action           = "drop"
+  src_address_list = "zone-vpn_tunnel"
+  dst_address_list = "zone-servers"
+  log              = true
+  log_prefix       = "DENY:vpn_tunnel→servers"
+  comment          = "ADR-0110 R4: uphill: level 2 → 4 - managed by topology"
+  place_before     = routeros_ip_firewall_filter.zone_drop_all_forward.id
+}
+
+resource "routeros_ip_firewall_filter" "zone_deny_vpn_tunnel_to_management" {
+  chain            = "forward"
+  action           = "drop"
+  src_address_list = "zone-vpn_tunnel"
+  dst_address_list = "zone-management"
+  log              = true
+  log_prefix       = "DENY:vpn_tunnel→management"
+  comment          = "ADR-0110 R4: uphill: level 2 → 5 - managed by topology"
+  place_before     = routeros_ip_firewall_filter.zone_drop_all_forward.id
+}
+
+resource "routeros_ip_firewall_filter" "zone_deny_user_to_management" {
+  chain            = "forward"
+  action           = "drop"
+  src_address_list = "zone-user"
+  dst_address_list = "zone-management"
+  log              = true
+  log_prefix       = "DENY:user→management"
+  comment          = "ADR-0110 R4: uphill: level 3 → 5 - managed by topology"
+  place_before     = routeros_ip_firewall_filter.zone_drop_all_forward.id
+}
+
+
+# ==============================================================================
+# 5. Matrix ALLOW Rules (downhill - optional, implicit in MikroTik default-allow)
+# ==============================================================================
+# Note: MikroTik has default-allow, so ALLOW rules are optional.
+# Uncomment if you want explicit ALLOW rules for audit/logging.
+# resource "routeros_ip_firewall_filter" "zone_allow_guest_to_untrusted" {
+#   chain            = "forward"
+#   action           = "accept"
+#   src_address_list = "zone-guest"
+#   dst_address_list = "zone-untrusted"
+#   comment          = "ADR-0110 R2: isolated zone can reach untrusted (internet) - managed by topology"
+# }
+
+# resource "routeros_ip_firewall_filter" "zone_allow_iot_to_untrusted" {
+#   chain            = "forward"
+#   action           = "accept"
+#   src_address_list = "zone-iot"
+#   dst_address_list = "zone-untrusted"
+#   comment          = "ADR-0110 R2: isolated zone can reach untrusted (internet) - managed by topology"
+# }
+
+# resource "routeros_ip_firewall_filter" "zone_allow_vpn_tunnel_to_untrusted" {
+#   chain            = "forward"
+#   action           = "accept"
+#   src_address_list = "zone-vpn_tunnel"
+#   dst_address_list = "zone-untrusted"
+#   comment          = "ADR-0110 R3: downhill: level 2 → 0 - managed by topology"
+# }
+
+# resource "routeros_ip_firewall_filter" "zone_allow_vpn_tunnel_to_guest" {
+#   chain            = "forward"
+#   action           = "accept"
+#   src_address_list = "zone-vpn_tunnel"
+#   dst_address_list = "zone-guest"
+#   comment          = "ADR-0110 R3: downhill: level 2 → 0 - managed by topology"
+# }
+
+# resource "routeros_ip_firewall_filter" "zone_allow_vpn_tunnel_to_iot" {
+#   chain            = "forward"
+#   action           = "accept"
+#   src_address_list = "zone-vpn_tunnel"
+#   dst_address_list = "zone-iot"
+#   comment          = "ADR-0110 R3: downhill: level 2 → 1 - managed by topology"
+# }
+
+# resource "routeros_ip_firewall_filter" "zone_allow_user_to_untrusted" {
+#   chain            = "forward"
+#   action           = "accept"
+#   src_address_list = "zone-user"
+#   dst_address_list = "zone-untrusted"
+#   comment          = "ADR-0110 R3: downhill: level 3 → 0 - managed by topology"
+# }
+
+# resource "routeros_ip_firewall_filter" "zone_allow_user_to_guest" {
+#   chain            = "forward"
+#   action           = "accept"
+#   src_address_list = "zone-user"
+#   dst_address_list = "zone-guest"
+#   comment          = "ADR-0110 R3: downhill: level 3 → 0 - managed by topology"
+# }
+
+# resource "routeros_ip_firewall_filter" "zone_allow_user_to_iot" {
+#   chain            = "forward"
+#   action           = "accept"
+#   src_address_list = "zone-user"
+#   dst_address_list = "zone-iot"
+#   comment          = "ADR-0110 R3: downhill: level 3 → 1 - managed by topology"
+# }
+
+# resource "routeros_ip_firewall_filter" "zone_allow_user_to_vpn_tunnel" {
+#   chain            = "forward"
+#   action           = "accept"
+#   src_address_list = "zone-user"
+#   dst_address_list = "zone-vpn_tunnel"
+#   comment          = "ADR-0110 R3: downhill: level 3 → 2 - managed by topology"
+# }
+
+# resource "routeros_ip_firewall_filter" "zone_allow_servers_to_untrusted" {
+#   chain            = "forward"
+#   action           = "accept"
+#   src_address_list = "zone-servers"
+#   dst_address_list = "zone-untrusted"
+#   comment          = "ADR-0110 R3: downhill: level 4 → 0 - managed by topology"
+# }
+
+# resource "routeros_ip_firewall_filter" "zone_allow_servers_to_guest" {
+#   chain            = "forward"
+#   action           = "accept"
+#   src_address_list = "zone-servers"
+#   dst_address_list = "zone-guest"
+#   comment          = "ADR-0110 R3: downhill: level 4 → 0 - managed by topology"
+# }
+
+# resource "routeros_ip_firewall_filter" "zone_allow_servers_to_iot" {
+#   chain            = "forward"
+#   action           = "accept"
+#   src_address_list = "zone-servers"
+#   dst_address_list = "zone-iot"
+#   comment          = "ADR-0110 R3: downhill: level 4 → 1 - managed by topology"
+# }
+
+# resource "routeros_ip_firewall_filter" "zone_allow_servers_to_vpn_tunnel" {
+#   chain            = "forward"
+#   action           = "accept"
+#   src_address_list = "zone-servers"
+#   dst_address_list = "zone-vpn_tunnel"
+#   comment          = "ADR-0110 R3: downhill: level 4 → 2 - managed by topology"
+# }
+
+# resource "routeros_ip_firewall_filter" "zone_allow_servers_to_user" {
+#   chain            = "forward"
+#   action           = "accept"
+#   src_address_list = "zone-servers"
+#   dst_address_list = "zone-user"
+#   comment          = "ADR-0110 R3: downhill: level 4 → 3 - managed by topology"
+# }
+
+# resource "routeros_ip_firewall_filter" "zone_allow_management_to_untrusted" {
+#   chain            = "forward"
+#   action           = "accept"
+#   src_address_list = "zone-management"
+#   dst_address_list = "zone-untrusted"
+#   comment          = "ADR-0110 R3: downhill: level 5 → 0 - managed by topology"
+# }
+
+# resource "routeros_ip_firewall_filter" "zone_allow_management_to_guest" {
+#   chain            = "forward"
+#   action           = "accept"
+#   src_address_list = "zone-management"
+#   dst_address_list = "zone-guest"
+#   comment          = "ADR-0110 R3: downhill: level 5 → 0 - managed by topology"
+# }
+
+# resource "routeros_ip_firewall_filter" "zone_allow_management_to_iot" {
+#   chain            = "forward"
+#   action           = "accept"
+#   src_address_list = "zone-management"
+#   dst_address_list = "zone-iot"
+#   comment          = "ADR-0110 R3: downhill: level 5 → 1 - managed by topology"
+# }
+
+# resource "routeros_ip_firewall_filter" "zone_allow_management_to_vpn_tunnel" {
+#   chain            = "forward"
+#   action           = "accept"
+#   src_address_list = "zone-management"
+#   dst_address_list = "zone-vpn_tunnel"
+#   comment          = "ADR-0110 R3: downhill: level 5 → 2 - managed by topology"
+# }
+
+# resource "routeros_ip_firewall_filter" "zone_allow_management_to_user" {
+#   chain            = "forward"
+#   action           = "accept"
+#   src_address_list = "zone-management"
+#   dst_address_list = "zone-user"
+#   comment          = "ADR-0110 R3: downhill: level 5 → 3 - managed by topology"
+# }
+
+
+# ==============================================================================
+# 6. FINAL DROP-ALL Rule (MANDATORY)
+# ==============================================================================
+resource "routeros_ip_firewall_filter" "zone_drop_all_forward" {
+  chain      = "forward"
+  action     = "drop"
+  log        = true
+  log_prefix = "DROP:final"
+  comment    = "ADR-0110: Final drop-all (implicit deny policy) - managed by topology"
+  depends_on = [routeros_ip_firewall_filter.zone_established_related]
+}
+
@@ -0,0 +1,46 @@
+output "projection_counts" {
+  description = "Topology projection counts"
+  value = {
+    routers  = 1
+    bridges  = 0
+    networks = 20
+    vlans    = 7
+    services = 5
+  }
+}
+
+output "vlan_interfaces" {
+  description = "Created VLAN interfaces"
+  value = {
+    user = {
+      interface = routeros_interface_vlan.user.name
+      vlan_id   = 10
+      gateway   = "192.168.10.1"
+      cidr      = "192.168.10.0/24"
+    }
+    guest = {
+      interface = routeros_interface_vlan.guest.name
+      vlan_id   = 20
+      gateway   = "192.168.20.1"
+      cidr      = "192.168.20.0/24"
+    }
+    iot = {
+      interface = routeros_interface_vlan.iot.name
+      vlan_id   = 30
+      gateway   = "192.168.30.1"
+      cidr      = "192.168.30.0/24"
+    }
+    vpn_germany = {
+      interface = routeros_interface_vlan.vpn_germany.name
+      vlan_id   = 55
+      gateway   = "192.168.55.1"
+      cidr      = "192.168.55.0/24"
+    }
+    management = {
+      interface = routeros_interface_vlan.management.name
+      vlan_id   = 99
+      gateway   = "10.0.99.1"
+      cidr      = "10.0.99.0/24"
+    }
+  }
+}
@@ -0,0 +1,96 @@
+# MikroTik WireGuard VPN configuration
+# Generated from topology - DO NOT EDIT MANUALLY
+
+locals {
+  wireguard_interface_name = "wg0"
+}
+
+# WireGuard Interface
+resource "routeros_interface_wireguard" "wg0" {
+  name        = local.wireguard_interface_name
+  listen_port = 51820
+  private_key = var.wireguard_private_key
+  mtu         = 1420
+  comment     = "WireGuard tunnel - managed by topology"
+}
+
+# WireGuard Peers
+resource "routeros_interface_wireguard_peer" "vps_oracle_frankfurt" {
+  interface            = routeros_interface_wireguard.wg0.name
+  public_key           = var.wireguard_peers[0].public_key
+  preshared_key        = var.wireguard_peers[0].preshared_key
+  endpoint_address     = var.wireguard_peers[0].endpoint_address
+  endpoint_port        = var.wireguard_peers[0].endpoint_port
+  allowed_address      = var.wireguard_peers[0].allowed_ips
+  persistent_keepalive = var.wireguard_peers[0].persistent_keepalive
+  comment              = "Remote: vps-oracle-frankfurt"
+}
+
+# WireGuard Interface IP Address
+resource "routeros_ip_address" "wg0" {
+  address   = "10.100.0.1/30"
+  interface = routeros_interface_wireguard.wg0.name
+  comment   = "WireGuard tunnel IP - managed by topology"
+}
+
+# Add WireGuard to LAN interface list (firewall trust)
+resource "routeros_interface_list_member" "wg0_lan" {
+  interface = routeros_interface_wireguard.wg0.name
+  list      = "LAN"
+  comment   = "Trust WireGuard tunnel - managed by topology"
+}
+
+# ==============================================================================
+# Policy-based routing: inst.routing_policy.vpn_germany
+# vpn-germany-routing (192.168.55.0/24 -> wg0)
+# ==============================================================================
+resource "routeros_routing_table" "vpn_germany" {
+  name = "vpn-tunnel"
+  fib  = true
+  comment = "vpn-germany-routing routing table - managed by topology"
+}
+
+resource "routeros_ip_firewall_mangle" "vpn_germany_mangle_1" {
+  chain  = "prerouting"
+  action = "mark-connection"
+  src_address = "192.168.55.0/24"
+  dst_address = "!192.168.55.0/24"
+  new_connection_mark = "vpn-germany"
+  passthrough = true
+  comment     = "vpn-germany-routing mangle - managed by topology"
+  depends_on = [routeros_routing_table.vpn_germany]
+}
+
+resource "routeros_ip_firewall_mangle" "vpn_germany_mangle_2" {
+  chain  = "prerouting"
+  action = "mark-routing"
+  src_address = "192.168.55.0/24"
+  connection_mark = "vpn-germany"
+  new_routing_mark = "vpn-tunnel"
+  passthrough = false
+  comment     = "vpn-germany-routing mangle - managed by topology"
+  depends_on = [routeros_ip_firewall_mangle.vpn_germany_mangle_1]
+}
+
+resource "routeros_ip_route" "vpn_germany_route_1" {
+  dst_address   = "0.0.0.0/0"
+  gateway       = "wg0"
+  routing_table = "vpn-tunnel"
+  comment       = "vpn-germany-routing route - managed by topology"
+  depends_on = [routeros_routing_table.vpn_germany]
+}
+
+# Tunnel egress: allow new connections from 192.168.55.0/24 out via wg0.
+# The zone firewall (ADR 0110) ends the forward chain with a final drop-all,
+# so without this rule marked traffic is routed into the tunnel but dropped.
+# place_before keeps this rule ahead of the final drop-all on the router.
+resource "routeros_ip_firewall_filter" "vpn_germany_tunnel_egress" {
+  chain         = "forward"
+  action        = "accept"
+  src_address   = "192.168.55.0/24"
+  out_interface = "wg0"
+  comment       = "vpn-germany-routing tunnel egress - managed by topology"
+  place_before  = routeros_ip_firewall_filter.zone_drop_all_forward.id
+
+  depends_on = [routeros_interface_wireguard.wg0]
+}
@@ -0,0 +1,5 @@
+provider "proxmox" {
+  endpoint  = var.proxmox_api_url
+  api_token = var.proxmox_api_token
+  insecure  = var.proxmox_insecure
+}
@@ -0,0 +1,4 @@
+# Baseline projection output; LXC resource rendering is added in parity phase.
+locals {
+  lxc_instances = ["lxc-docker", "lxc-gitea", "lxc-grafana", "lxc-homeassistant", "lxc-nextcloud", "lxc-nginx-proxy", "lxc-postgresql", "lxc-prometheus", "lxc-redis"]
+}
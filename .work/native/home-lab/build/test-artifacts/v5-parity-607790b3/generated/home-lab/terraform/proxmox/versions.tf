@@ -0,0 +1,9 @@
+terraform {
+  required_version = ">= 1.6.0"
+  required_providers {
+    proxmox = {
+      source  = "bpg/proxmox"
+      version = ">= 0.66.0"
+    }
+  }
+}
@@ -0,0 +1,71 @@
+# MikroTik VLAN interfaces generated from topology
+# Routers: ["rtr-mikrotik-chateau"]
+
+locals {
+  mikrotik_routers = ["rtr-mikrotik-chateau"]
+}
+
+
+
+# VLAN interfaces on bridge
+# Note: Run scripts/deploy/mikrotik_terraform_import.sh before first apply
+resource "routeros_interface_vlan" "user" {
+  name      = "vlan10"
+  vlan_id   = 10
+  interface = "bridge"
+  mtu       = 1500
+  comment   = "inst.vlan.user - managed by topology"
+
+  lifecycle {
+    create_before_destroy = false
+  }
+}
+
+resource "routeros_interface_vlan" "guest" {
+  name      = "vlan20"
+  vlan_id   = 20
+  interface = "bridge"
+  mtu       = 1500
+  comment   = "inst.vlan.guest - managed by topology"
+
+  lifecycle {
+    create_before_destroy = false
+  }
+}
+
+resource "routeros_interface_vlan" "iot" {
+  name      = "vlan30"
+  vlan_id   = 30
+  interface = "bridge"
+  mtu       = 1500
+  comment   = "inst.vlan.iot - managed by topology"
+
+  lifecycle {
+    create_before_destroy = false
+  }
+}
+
+resource "routeros_interface_vlan" "vpn_germany" {
+  name      = "vlan55"
+  vlan_id   = 55
+  interface = "bridge"
+  mtu       = 1420
+  comment   = "inst.vlan.vpn_germany - managed by topology"
+
+  lifecycle {
+    create_before_destroy = false
+  }
+}
+
+resource "routeros_interface_vlan" "management" {
+  name      = "vlan99"
+  vlan_id   = 99
+  interface = "bridge"
+  mtu       = 1500
+  comment   = "inst.vlan.management - managed by topology"
+
+  lifecycle {
+    create_before_destroy = false
+  }
+}
+